@@ -163,6 +163,17 @@ COMMON_CONFIG = {
     # Disable eager execution on workers (but allow it on the driver). This
     # only has an effect if eager is enabled.
     "no_eager_on_workers": False,
+    # Compile the policy graph with XLA (TF policies built with
+    # build_tf_policy only; in eager mode this requires `eager_tracing`).
+    # This clusters and fuses the model, loss and gradient ops as well as the
+    # optimizer update, which can speed up small policies considerably on GPU.
+    # Leave this off if your model uses ops that XLA can't compile (e.g.,
+    # ops with dynamic output shapes).
+    "xla": False,
+    # Compile just the loss of TF graph-mode policies built with
+    # build_tf_policy with XLA. This forces XLA to fuse the loss ops even if
+    # they are not clustered by "xla" or session-level auto-clustering.
+    "fuse_loss": False,
 
     # === Evaluation Settings ===
     # Evaluate with every `evaluation_interval` training iterations.
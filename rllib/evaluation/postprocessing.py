@@ -35,7 +35,9 @@ def compute_advantages(rollout, last_r, gamma=0.9, lambda_=1.0, use_gae=True):
     traj = {}
     trajsize = len(rollout[SampleBatch.ACTIONS])
     for key in rollout:
-        traj[key] = np.stack(rollout[key])
+        # columns are already arrays, so copy them directly instead of
+        # re-stacking them row by row
+        traj[key] = np.array(rollout[key])
 
     if use_gae:
         assert SampleBatch.VF_PREDS in rollout, "Values not found!"
@@ -330,22 +330,14 @@ def average_gradients(tower_grads):
 
         # Note that each grad_and_vars looks like the following:
         #   ((grad0_gpu0, var0_gpu0), ... , (grad0_gpuN, var0_gpuN))
-        grads = []
-        for g, _ in grad_and_vars:
-            if g is not None:
-                # Add 0 dimension to the gradients to represent the tower.
-                expanded_g = tf.expand_dims(g, 0)
-
-                # Append on a 'tower' dimension which we will average over
-                # below.
-                grads.append(expanded_g)
+        grads = [g for g, _ in grad_and_vars if g is not None]
 
         if not grads:
             continue
 
-        # Average over the 'tower' dimension.
-        grad = tf.concat(axis=0, values=grads)
-        grad = tf.reduce_mean(grad, 0)
+        # Average over the towers. Summing with add_n avoids materializing
+        # a stacked [num_towers, ...] copy of the gradients first.
+        grad = tf.add_n([tf.convert_to_tensor(g) for g in grads]) / len(grads)
 
         # Keep in mind that the Variables are redundant because they are shared
         # across towers. So .. we will just return the first tower's pointer to
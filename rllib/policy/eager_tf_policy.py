@@ -4,6 +4,7 @@ It supports both traced and non-traced eager execution modes."""
 
 import logging
 import functools
+import inspect
 import numpy as np
 
 from ray.rllib.evaluation.episode import _flatten_action
@@ -78,10 +79,26 @@ def _disallow_var_creation(next_creator, **kw):
                      "model initialization: {}".format(v.name))
 
 
+def _traced_function_kwargs(xla=False):
+    """Returns the tf.function() kwargs to use for tracing policy methods."""
+
+    kwargs = {"autograph": False}
+    if xla:
+        # `experimental_compile` was renamed to `jit_compile` in TF 2.5
+        if "jit_compile" in inspect.signature(tf.function).parameters:
+            kwargs["jit_compile"] = True
+        else:
+            kwargs["experimental_compile"] = True
+    return kwargs
+
+
 def traced_eager_policy(eager_policy_cls):
     """Wrapper that enables tracing for all eager policy methods.
 
-    This is enabled by the --trace / "eager_tracing" config."""
+    This is enabled by the --trace / "eager_tracing" config. If the "xla"
+    config is also set, the traced learn_on_batch() and compute_gradients()
+    are additionally compiled with XLA. For learn_on_batch() this covers the
+    whole step: loss, gradients, stats, and the optimizer update."""
 
     class TracedEagerPolicy(eager_policy_cls):
         def __init__(self, *args, **kwargs):
@@ -99,7 +116,7 @@ def traced_eager_policy(eager_policy_cls):
             if self._traced_learn_on_batch is None:
                 self._traced_learn_on_batch = tf.function(
                     super(TracedEagerPolicy, self).learn_on_batch,
-                    autograph=False)
+                    **_traced_function_kwargs(self.config.get("xla")))
 
             return self._traced_learn_on_batch(samples)
 
@@ -137,7 +154,7 @@ def traced_eager_policy(eager_policy_cls):
             if self._traced_compute_gradients is None:
                 self._traced_compute_gradients = tf.function(
                     super(TracedEagerPolicy, self).compute_gradients,
-                    autograph=False)
+                    **_traced_function_kwargs(self.config.get("xla")))
 
             return self._traced_compute_gradients(samples)
 
@@ -169,6 +186,7 @@ def build_eager_tf_policy(name,
                           grad_stats_fn=None,
                           extra_learn_fetches_fn=None,
                           extra_action_fetches_fn=None,
+                          extra_action_feed_fn=None,
                           before_init=None,
                           before_loss_init=None,
                           after_init=None,
@@ -188,6 +206,11 @@ def build_eager_tf_policy(name,
 
     This has the same signature as build_tf_policy()."""
 
+    if extra_action_feed_fn:
+        raise ValueError(
+            "extra_action_feed_fn is not supported in eager mode, since "
+            "there are no placeholders to feed.")
+
     base = add_mixins(Policy, mixins)
 
     class eager_policy_cls(base):
@@ -1,13 +1,21 @@
+import functools
+from types import MappingProxyType
+
+from ray.rllib.models.modelv2 import NullContextManager
 from ray.rllib.policy.dynamic_tf_policy import DynamicTFPolicy
 from ray.rllib.policy import eager_tf_policy
 from ray.rllib.policy.policy import Policy, LEARNER_STATS_KEY
 from ray.rllib.policy.tf_policy import TFPolicy
 from ray.rllib.utils import add_mixins
 from ray.rllib.utils.annotations import override, DeveloperAPI
+from ray.rllib.utils.tf_ops import fuse_loss
 from ray.rllib.utils import try_import_tf
 
 tf = try_import_tf()
 
+# Shared read-only feed dict for policies without extra action feeds.
+_EMPTY_FEED_DICT = MappingProxyType({})
+
 
 @DeveloperAPI
 def build_tf_policy(name,
@@ -21,6 +29,7 @@ def build_tf_policy(name,
                     grad_stats_fn=None,
                     extra_action_fetches_fn=None,
                     extra_learn_fetches_fn=None,
+                    extra_action_feed_fn=None,
                     before_init=None,
                     before_loss_init=None,
                     after_init=None,
@@ -55,7 +64,10 @@ def build_tf_policy(name,
         get_default_config (func): optional function that returns the default
             config to merge with any overrides
         postprocess_fn (func): optional experience postprocessing function
-            that takes the same args as Policy.postprocess_trajectory()
+            that takes the same args as Policy.postprocess_trajectory(). For
+            advantage estimation, prefer the vectorized
+            evaluation.postprocessing.compute_advantages() over per-sample
+            Python loops
         stats_fn (func): optional function that returns a dict of
             TF fetches given the policy and batch input tensors
         optimizer_fn (func): optional function that returns a tf.Optimizer
@@ -70,7 +82,13 @@ def build_tf_policy(name,
         extra_action_fetches_fn (func): optional function that returns
             a dict of TF fetches given the policy object
         extra_learn_fetches_fn (func): optional function that returns a dict of
-            extra values to fetch and return when learning on a batch
+            extra values to fetch and return when learning on a batch. The
+            returned dict is updated in place, so a new dict should be
+            returned on each call
+        extra_action_feed_fn (func): optional function that returns a feed
+            dict to also feed to TF when computing actions. This is called
+            once per compute_actions() call, i.e., once for the whole batch
+            of vectorized envs of a rollout worker
         before_init (func): optional function to run at the beginning of
             policy init that takes the same arguments as the policy constructor
         before_loss_init (func): optional function to run prior to loss
@@ -97,8 +115,24 @@ def build_tf_policy(name,
         a DynamicTFPolicy instance that uses the specified args
     """
     original_kwargs = locals().copy()
+    # copy the mixins list so that with_updates() isn't affected by later
+    # modifications of the caller's list
+    if mixins:
+        original_kwargs["mixins"] = list(mixins)
     base = add_mixins(DynamicTFPolicy, mixins)
 
+    # Default config, fetched on first policy init and reused afterwards.
+    # This can't be fetched here since get_default_config() often refers to
+    # a trainer module that imports this policy. Holds at most one element,
+    # so that an empty default config is also only fetched once.
+    default_config = []
+
+    before_loss_init_wrapper = functools.partial(
+        _before_loss_init,
+        before_loss_init=before_loss_init,
+        extra_action_fetches_fn=extra_action_fetches_fn,
+        base_action_fetches_fn=base.extra_compute_action_fetches)
+
     class policy_cls(base):
         def __init__(self,
                      obs_space,
@@ -107,88 +141,110 @@ def build_tf_policy(name,
                      existing_model=None,
                      existing_inputs=None):
             if get_default_config:
-                config = dict(get_default_config(), **config)
+                if not default_config:
+                    default_config.append(get_default_config())
+                config = dict(default_config[0], **config)
 
             if before_init:
                 before_init(self, obs_space, action_space, config)
 
-            def before_loss_init_wrapper(policy, obs_space, action_space,
-                                         config):
-                if before_loss_init:
-                    before_loss_init(policy, obs_space, action_space, config)
-                if extra_action_fetches_fn is None:
-                    self._extra_action_fetches = {}
-                else:
-                    self._extra_action_fetches = extra_action_fetches_fn(self)
-
-            DynamicTFPolicy.__init__(
-                self,
-                obs_space,
-                action_space,
-                config,
-                loss_fn,
-                stats_fn=stats_fn,
-                grad_stats_fn=grad_stats_fn,
-                before_loss_init=before_loss_init_wrapper,
-                make_model=make_model,
-                action_sampler_fn=action_sampler_fn,
-                existing_model=existing_model,
-                existing_inputs=existing_inputs,
-                get_batch_divisibility_req=get_batch_divisibility_req,
-                obs_include_prev_action_reward=obs_include_prev_action_reward)
+            with _xla_scope(config):
+                DynamicTFPolicy.__init__(
+                    self,
+                    obs_space,
+                    action_space,
+                    config,
+                    fuse_loss(loss_fn) if config.get("fuse_loss") else loss_fn,
+                    stats_fn=stats_fn,
+                    grad_stats_fn=grad_stats_fn,
+                    before_loss_init=before_loss_init_wrapper,
+                    make_model=make_model,
+                    action_sampler_fn=action_sampler_fn,
+                    existing_model=existing_model,
+                    existing_inputs=existing_inputs,
+                    get_batch_divisibility_req=get_batch_divisibility_req,
+                    obs_include_prev_action_reward=(
+                        obs_include_prev_action_reward))
 
             if after_init:
                 after_init(self, obs_space, action_space, config)
 
-        @override(Policy)
-        def postprocess_trajectory(self,
-                                   sample_batch,
-                                   other_agent_batches=None,
-                                   episode=None):
-            if not postprocess_fn:
-                return sample_batch
-            return postprocess_fn(self, sample_batch, other_agent_batches,
-                                  episode)
+        # Only override the methods for which a function was given, so that
+        # the optional function checks happen once here instead of per call.
+        if postprocess_fn:
 
-        @override(TFPolicy)
-        def optimizer(self):
-            if optimizer_fn:
+            @override(Policy)
+            def postprocess_trajectory(self,
+                                       sample_batch,
+                                       other_agent_batches=None,
+                                       episode=None):
+                return postprocess_fn(self, sample_batch, other_agent_batches,
+                                      episode)
+        else:
+            # pass through, even if a mixin defines its own postprocessing
+            postprocess_trajectory = Policy.postprocess_trajectory
+
+        if optimizer_fn:
+
+            @override(TFPolicy)
+            def optimizer(self):
                 return optimizer_fn(self, self.config)
-            else:
-                return base.optimizer(self)
 
-        @override(TFPolicy)
-        def gradients(self, optimizer, loss):
-            if gradients_fn:
-                return gradients_fn(self, optimizer, loss)
-            else:
-                return base.gradients(self, optimizer, loss)
+        # Gradients are also built outside of __init__ (e.g., for the towers
+        # of the multi-GPU optimizer), so enter the XLA scope here as well.
+        if gradients_fn:
 
-        @override(TFPolicy)
-        def build_apply_op(self, optimizer, grads_and_vars):
-            if apply_gradients_fn:
+            @override(TFPolicy)
+            def gradients(self, optimizer, loss):
+                with _xla_scope(self.config):
+                    return gradients_fn(self, optimizer, loss)
+        else:
+
+            @override(TFPolicy)
+            def gradients(self, optimizer, loss):
+                with _xla_scope(self.config):
+                    return base.gradients(self, optimizer, loss)
+
+        if apply_gradients_fn:
+
+            @override(TFPolicy)
+            def build_apply_op(self, optimizer, grads_and_vars):
                 return apply_gradients_fn(self, optimizer, grads_and_vars)
-            else:
-                return base.build_apply_op(self, optimizer, grads_and_vars)
 
         @override(TFPolicy)
-        def extra_compute_action_fetches(self):
-            return dict(
-                base.extra_compute_action_fetches(self),
-                **self._extra_action_fetches)
+        def copy(self, existing_inputs):
+            # the loss of a copy is initialized after __init__ returns
+            with _xla_scope(self.config):
+                return base.copy(self, existing_inputs)
 
         @override(TFPolicy)
-        def extra_compute_grad_fetches(self):
-            if extra_learn_fetches_fn:
+        def extra_compute_action_fetches(self):
+            return self._merged_action_fetches
+
+        if extra_action_feed_fn:
+
+            @override(TFPolicy)
+            def extra_compute_action_feed_dict(self):
+                return extra_action_feed_fn(self)
+        elif (base.extra_compute_action_feed_dict is
+              TFPolicy.extra_compute_action_feed_dict):
+
+            # avoid allocating a new empty dict on each compute_actions()
+            @override(TFPolicy)
+            def extra_compute_action_feed_dict(self):
+                return _EMPTY_FEED_DICT
+
+        if extra_learn_fetches_fn:
+
+            @override(TFPolicy)
+            def extra_compute_grad_fetches(self):
+                fetches = extra_learn_fetches_fn(self)
                 # auto-add empty learner stats dict if needed
-                return dict({
-                    LEARNER_STATS_KEY: {}
-                }, **extra_learn_fetches_fn(self))
-            else:
-                return base.extra_compute_grad_fetches(self)
+                fetches.setdefault(LEARNER_STATS_KEY, {})
+                return fetches
 
     def with_updates(**overrides):
-        return build_tf_policy(**dict(original_kwargs, **overrides))
+        return build_tf_policy(**{**original_kwargs, **overrides})
 
     def as_eager():
         return eager_tf_policy.build_eager_tf_policy(**original_kwargs)
@@ -198,3 +254,36 @@ def build_tf_policy(name,
     policy_cls.__name__ = name
     policy_cls.__qualname__ = name
     return policy_cls
+
+
+def _xla_scope(config):
+    """Returns a scope marking the ops created in it for XLA compilation.
+
+    This is a no-op scope unless the "xla" config is enabled.
+    """
+
+    if config.get("xla"):
+        return tf.xla.experimental.jit_scope(compile_ops=True)
+    else:
+        return NullContextManager()
+
+
+def _before_loss_init(policy,
+                      obs_space,
+                      action_space,
+                      config,
+                      before_loss_init=None,
+                      extra_action_fetches_fn=None,
+                      base_action_fetches_fn=None):
+    """Runs the user's before_loss_init and sets up the action fetches."""
+
+    if before_loss_init:
+        before_loss_init(policy, obs_space, action_space, config)
+    if extra_action_fetches_fn is None:
+        extra_action_fetches = {}
+    else:
+        extra_action_fetches = extra_action_fetches_fn(policy)
+    # the fetches don't change after init, so merge them once here instead
+    # of on each compute_actions() call
+    policy._merged_action_fetches = dict(
+        base_action_fetches_fn(policy), **extra_action_fetches)
@@ -54,6 +54,10 @@ def build_torch_policy(name,
     """
 
     original_kwargs = locals().copy()
+    # copy the mixins list so that with_updates() isn't affected by later
+    # modifications of the caller's list
+    if mixins:
+        original_kwargs["mixins"] = list(mixins)
     base = add_mixins(TorchPolicy, mixins)
 
     class policy_cls(base):
@@ -134,7 +138,7 @@ def build_torch_policy(name,
                 return TorchPolicy.extra_grad_info(self, train_batch)
 
     def with_updates(**overrides):
-        return build_torch_policy(**dict(original_kwargs, **overrides))
+        return build_torch_policy(**{**original_kwargs, **overrides})
 
     policy_cls.with_updates = staticmethod(with_updates)
     policy_cls.__name__ = name
@@ -0,0 +1,53 @@
+import unittest
+
+from ray.rllib.utils import add_mixins
+
+
+class Base:
+    def name(self):
+        return "Base"
+
+    def base_only(self):
+        return "Base"
+
+
+class M1:
+    def name(self):
+        return "M1"
+
+
+class M2:
+    def name(self):
+        return "M2"
+
+    def m2_only(self):
+        return "M2"
+
+
+class AddMixinsTest(unittest.TestCase):
+    def testNoMixins(self):
+        self.assertIs(add_mixins(Base, None), Base)
+        self.assertIs(add_mixins(Base, []), Base)
+
+    def testMroOrder(self):
+        cls = add_mixins(Base, [M1, M2])
+        self.assertEqual(cls.__mro__[1:], (M1, M2, Base, object))
+
+    def testMixinPrecedence(self):
+        self.assertEqual(add_mixins(Base, [M1, M2])().name(), "M1")
+        self.assertEqual(add_mixins(Base, [M2, M1])().name(), "M2")
+        obj = add_mixins(Base, [M1, M2])()
+        self.assertEqual(obj.m2_only(), "M2")
+        self.assertEqual(obj.base_only(), "Base")
+        self.assertIsInstance(obj, Base)
+
+    def testMixinsListNotModified(self):
+        mixins = [M1, M2]
+        add_mixins(Base, mixins)
+        self.assertEqual(mixins, [M1, M2])
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
@@ -1,8 +1,13 @@
+import inspect
 import unittest
 
 import ray
 from ray import tune
 from ray.rllib.agents.registry import get_agent_class
+from ray.rllib.policy.eager_tf_policy import _traced_function_kwargs
+from ray.rllib.utils import try_import_tf
+
+tf = try_import_tf()
 
 
 def check_support(alg, config, test_trace=True):
@@ -45,6 +50,9 @@ class TestEagerSupport(unittest.TestCase):
     def testPG(self):
         check_support("PG", {"num_workers": 0})
 
+    def testPGWithXLA(self):
+        check_support("PG", {"num_workers": 0, "xla": True})
+
     def testPPO(self):
         check_support("PPO", {"num_workers": 0})
 
@@ -65,6 +73,21 @@ class TestEagerSupport(unittest.TestCase):
             })
 
 
+class TestTracedFunctionKwargs(unittest.TestCase):
+    def testWithoutXLA(self):
+        self.assertEqual(_traced_function_kwargs(), {"autograph": False})
+
+    def testWithXLA(self):
+        kwargs = _traced_function_kwargs(xla=True)
+        if "jit_compile" in inspect.signature(tf.function).parameters:
+            expected = {"autograph": False, "jit_compile": True}
+        else:
+            expected = {"autograph": False, "experimental_compile": True}
+        self.assertEqual(kwargs, expected)
+        # the selected kwargs must be accepted by this TF version
+        tf.function(lambda x: x, **kwargs)
+
+
 if __name__ == "__main__":
     import pytest
     import sys
@@ -0,0 +1,175 @@
+import numpy as np
+import unittest
+
+from gym.spaces import Box, Discrete
+
+from ray.rllib.agents.trainer import COMMON_CONFIG
+from ray.rllib.policy.policy import ACTION_PROB, LEARNER_STATS_KEY
+from ray.rllib.policy.sample_batch import SampleBatch
+from ray.rllib.policy.tf_policy_template import build_tf_policy
+from ray.rllib.utils import try_import_tf
+from ray.rllib.utils.tf_ops import fuse_loss
+
+tf = try_import_tf()
+
+OBS_SPACE = Box(-1.0, 1.0, (4, ))
+ACTION_SPACE = Discrete(2)
+
+
+def loss_fn(policy, model, dist_class, train_batch):
+    logits, _ = model.from_batch(train_batch)
+    action_dist = dist_class(logits, model)
+    return -tf.reduce_mean(action_dist.logp(train_batch[SampleBatch.ACTIONS]))
+
+
+def make_policy(config=None, **kwargs):
+    policy_cls = build_tf_policy(
+        "TestTFPolicy",
+        loss_fn=loss_fn,
+        get_default_config=lambda: COMMON_CONFIG,
+        **kwargs)
+    return policy_cls(OBS_SPACE, ACTION_SPACE, config or {})
+
+
+def make_train_batch(n=4):
+    return SampleBatch({
+        SampleBatch.CUR_OBS: np.zeros((n, 4), dtype=np.float32),
+        SampleBatch.PREV_ACTIONS: np.zeros(n, dtype=np.int64),
+        SampleBatch.PREV_REWARDS: np.zeros(n, dtype=np.float32),
+        SampleBatch.ACTIONS: np.zeros(n, dtype=np.int64),
+    })
+
+
+def make_tower(policy):
+    return policy.copy(
+        [tf.placeholder(v.dtype, v.shape) for _, v in policy._loss_inputs])
+
+
+def xla_marked(tensor):
+    try:
+        return tensor.op.get_attr("_XlaCompile")
+    except ValueError:
+        return False
+
+
+class TFPolicyTemplateTest(unittest.TestCase):
+    def testXlaDisabledByDefault(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy()
+            self.assertFalse(xla_marked(policy._loss))
+
+    def testXlaMarksLossAndGradients(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy({"xla": True})
+            self.assertTrue(xla_marked(policy._loss))
+            self.assertTrue(all(xla_marked(g) for g in policy._grads))
+
+    def testXlaMarksMultiGPUTowers(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy({"xla": True})
+            # towers are built like in LocalMultiGPUOptimizer
+            tower = make_tower(policy)
+            self.assertTrue(xla_marked(tower._loss))
+            grads = tower.gradients(policy._optimizer, tower._loss)
+            self.assertTrue(
+                all(xla_marked(g) for g, _ in grads if g is not None))
+
+    def testExtraActionFetchesMergedOnce(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy(
+                extra_action_fetches_fn=lambda p: {
+                    "extra": tf.ones_like(
+                        p.get_placeholder(SampleBatch.CUR_OBS)[:, 0])
+                })
+            fetches = policy.extra_compute_action_fetches()
+            self.assertIs(fetches, policy.extra_compute_action_fetches())
+            self.assertIn(ACTION_PROB, fetches)
+            self.assertIn("extra", fetches)
+            _, _, info = policy.compute_actions(np.zeros((2, 4)))
+            self.assertEqual(list(info["extra"]), [1.0, 1.0])
+
+    def testExtraLearnFetches(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy(
+                extra_learn_fetches_fn=lambda p: {"loss": p._loss})
+            fetches = policy.extra_compute_grad_fetches()
+            self.assertEqual(fetches[LEARNER_STATS_KEY], {})
+            result = policy.learn_on_batch(make_train_batch())
+            self.assertIn("loss", result)
+            self.assertIn(LEARNER_STATS_KEY, result)
+
+    def testExtraLearnFetchesKeepUserStats(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy(
+                extra_learn_fetches_fn=lambda p: {
+                    LEARNER_STATS_KEY: {"custom": p._loss}
+                })
+            result = policy.learn_on_batch(make_train_batch())
+            self.assertIn("custom", result[LEARNER_STATS_KEY])
+
+    def testExtraActionFeedFn(self):
+        def before_init(policy, obs_space, action_space, config):
+            policy.scale = tf.placeholder(tf.float32, (), name="scale")
+
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy(
+                before_init=before_init,
+                extra_action_feed_fn=lambda p: {p.scale: 3.0},
+                extra_action_fetches_fn=lambda p: {
+                    "scaled": p.scale * tf.ones_like(
+                        p.get_placeholder(SampleBatch.CUR_OBS)[:, 0])
+                })
+            _, _, info = policy.compute_actions(np.zeros((2, 4)))
+            self.assertEqual(list(info["scaled"]), [3.0, 3.0])
+
+    def testExtraActionFeedFnNotSupportedInEager(self):
+        policy_cls = build_tf_policy(
+            "TestTFPolicy",
+            loss_fn=loss_fn,
+            extra_action_feed_fn=lambda p: {})
+        self.assertRaises(ValueError, policy_cls.as_eager)
+
+    def testDefaultConfigFetchedOnce(self):
+        calls = []
+
+        def get_default_config():
+            calls.append(1)
+            return {}
+
+        policy_cls = build_tf_policy(
+            "TestTFPolicy",
+            loss_fn=loss_fn,
+            get_default_config=get_default_config)
+        for _ in range(2):
+            with tf.Graph().as_default(), tf.Session().as_default():
+                policy_cls(OBS_SPACE, ACTION_SPACE, dict(COMMON_CONFIG))
+        self.assertEqual(len(calls), 1)
+
+    def testFuseLoss(self):
+        with tf.Graph().as_default():
+            x = tf.placeholder(tf.float32, [None])
+            fused_fn = fuse_loss(lambda x: tf.reduce_sum(tf.tanh(x)))
+            self.assertTrue(xla_marked(fused_fn(x)))
+
+    def testFuseLossConfig(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy({"fuse_loss": True})
+            self.assertTrue(xla_marked(policy._loss))
+            self.assertTrue(xla_marked(make_tower(policy)._loss))
+
+    def testEmptyActionFeedDictShared(self):
+        with tf.Graph().as_default(), tf.Session().as_default():
+            policy = make_policy()
+            feed_dict = policy.extra_compute_action_feed_dict()
+            self.assertIs(feed_dict, policy.extra_compute_action_feed_dict())
+            self.assertEqual(len(feed_dict), 0)
+            with self.assertRaises(TypeError):
+                feed_dict["x"] = 1
+            actions, _, _ = policy.compute_actions(np.zeros((2, 4)))
+            self.assertEqual(len(actions), 2)
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
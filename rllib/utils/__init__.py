@@ -18,16 +18,12 @@ from ray.tune.utils import merge_dicts, deep_update
 def add_mixins(base, mixins):
     """Returns a new class with mixins applied in priority order."""
 
-    mixins = list(mixins or [])
+    if not mixins:
+        return base
 
-    while mixins:
-
-        class new_base(mixins.pop(), base):
-            pass
-
-        base = new_base
-
-    return base
+    # build the combined class in a single step, rather than nesting one
+    # intermediate class per mixin
+    return type(base.__name__ + "WithMixins", tuple(mixins) + (base, ), {})
 
 
 def force_list(elements=None, to_tuple=False):
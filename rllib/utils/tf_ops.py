@@ -1,3 +1,5 @@
+import functools
+
 from ray.rllib.utils import try_import_tf
 
 tf = try_import_tf()
@@ -92,6 +94,30 @@ def make_tf_callable(session_or_none, dynamic_shape=False):
     return make_wrapper
 
 
+def fuse_loss(loss_fn):
+    """Wraps a loss function so that all of its ops are compiled with XLA.
+
+    Even with XLA auto-clustering enabled for the session, composite ops such
+    as GELU or the tanh / pow / exp / log_prob chains of policy gradient
+    losses are often left as separate kernels, each reading and writing the
+    full activation tensor. Explicitly marking the loss ops for compilation
+    lets XLA fuse them into a single kernel.
+
+    Arguments:
+        loss_fn (func): loss function, e.g. as passed to build_tf_policy().
+
+    Returns:
+        a loss function with the same signature as `loss_fn`.
+    """
+
+    @functools.wraps(loss_fn)
+    def fused_loss_fn(*args, **kwargs):
+        with tf.xla.experimental.jit_scope(compile_ops=True):
+            return loss_fn(*args, **kwargs)
+
+    return fused_loss_fn
+
+
 def scope_vars(scope, trainable_only=False):
     """
     Get variables inside a scope